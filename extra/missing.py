@@ -3,21 +3,51 @@
 from __future__ import annotations
 
 import argparse
+import os
 import re
+import shutil
+import threading
+from array import array
+from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
+from http.client import HTTPConnection, HTTPException, HTTPResponse, HTTPSConnection
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Iterable, List, Sequence
+from typing import Callable, Iterable, Iterator, List, Sequence, TextIO
 from urllib.error import HTTPError, URLError
-from urllib.parse import quote
-from urllib.request import Request, urlopen
+from urllib.parse import quote, unquote, urljoin, urlsplit, urlunsplit
+from urllib.request import getproxies, proxy_bypass
+
+try:
+	import numpy as np
+except ImportError: # pragma: no cover - NumPy only speeds up gap detection
+	np = None
 
 VALID_EXTENSIONS = {".webp", ".png", ".jpg", ".jpeg"}
+VALID_EXT_TUPLE = tuple(VALID_EXTENSIONS)
 NUMBER_PATTERN = re.compile(r"(\d+)")
+TRAILING_NUMBER_PATTERN = re.compile(r"(\d+)\D*$")
+_search_trailing_number = TRAILING_NUMBER_PATTERN.search
 CHAPTER_PATTERN = re.compile(r"chapter\s*(\d+)", re.IGNORECASE)
 VOLUME_PATTERN = re.compile(r"volume\s*\d+", re.IGNORECASE)
+WHITESPACE_PATTERN = re.compile(r"\s+")
+_collapse_whitespace = WHITESPACE_PATTERN.sub
 DEFAULT_LAST_FILE = Path(__file__).resolve().parents[1] / "last.txt"
 USER_AGENT = "waguri-missing-panels/1.0"
+# Concurrent downloads; every template points at the same CDN host, so this
+# doubles as the per-host cap.
+DOWNLOAD_WORKERS = 4
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# urllib's HTTPRedirectHandler limit.
+MAX_REDIRECTS = 10
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+# Measured crossover: NumPy's fixed call overhead (~10-25 µs) only pays off once a
+# chapter has a few hundred panels; typical chapters stay on the pure-Python scan.
+NUMPY_GAP_THRESHOLD = 500
+# Largest value an array("q") slot can hold.
+PANEL_NUMBER_MAX = 2**63 - 1
 DEFAULT_DOWNLOAD_BASE = (
 	"https://eu2.contabostorage.com/2352a0b47a16442aa2bd93b0a47735ea:manga/"
 	"fragrant/Chapter%20{chapter}/{panel}.jpg"
@@ -42,7 +72,7 @@ def guess_extension_from_template(template: str, default: str = ".bin") -> str:
 	return default
 
 
-@dataclass
+@dataclass(slots=True)
 class ChapterReport:
 	name: str
 	path: Path
@@ -53,32 +83,33 @@ class ChapterReport:
 	duplicates: List[int]
 
 
-def extract_panel_number(path: Path) -> int | None:
-	"""Return the last integer found in the filename stem, if any."""
-	match = NUMBER_PATTERN.findall(path.stem)
-	if not match:
-		return None
-	return int(match[-1])
-
-
-def collect_panel_numbers(chapter_path: Path) -> tuple[List[int], List[int]]:
+def collect_panel_numbers(chapter_path: Path) -> tuple[array[int], List[int]]:
 	"""Gather sorted panel numbers and note duplicates within the chapter."""
-	numbers: List[int] = []
-	duplicates: List[int] = []
-	seen = set()
-	for file in sorted(chapter_path.iterdir()):
-		if not file.is_file():
-			continue
-		if file.suffix.lower() not in VALID_EXTENSIONS:
-			continue
-		number = extract_panel_number(file)
-		if number is None:
-			continue
-		numbers.append(number)
-		if number in seen and number not in duplicates:
-			duplicates.append(number)
-		seen.add(number)
-	return sorted(numbers), sorted(duplicates)
+	numbers: array[int] = array("q")
+	duplicates: set[int] = set()
+	seen: set[int] = set()
+	# Only the numeric order matters, so entries are consumed in directory order
+	# and sorted once at the end.
+	with os.scandir(chapter_path) as it:
+		for entry in it:
+			name = entry.name
+			if not (entry.is_file() and name.lower().endswith(VALID_EXT_TUPLE)):
+				continue
+			# Panel extensions carry no digits, so the trailing number of the full
+			# name is the last integer in the stem.
+			match = _search_trailing_number(name)
+			if match is None:
+				continue
+			number = int(match.group(1))
+			if number > PANEL_NUMBER_MAX:
+				# Long numeric IDs are not panel numbers and would overflow the typed array.
+				print(f"Skipping {entry.path}: number too large to be a panel number.")
+				continue
+			numbers.append(number)
+			if number in seen:
+				duplicates.add(number)
+			seen.add(number)
+	return array("q", sorted(numbers)), sorted(duplicates)
 
 
 def find_missing(numbers: Sequence[int]) -> List[int]:
@@ -86,6 +117,18 @@ def find_missing(numbers: Sequence[int]) -> List[int]:
 	missing: List[int] = []
 	if len(numbers) < 2:
 		return missing
+	if np is not None and len(numbers) > NUMPY_GAP_THRESHOLD:
+		values = np.asarray(numbers, dtype=np.int64)
+		gaps = np.diff(values) - 1
+		gap_idx = np.nonzero(gaps > 0)[0]
+		if not gap_idx.size:
+			return missing
+		# Expand every gap in one pass: each output value is its gap's first missing
+		# number plus its position within that gap, so no per-gap arange is needed.
+		lengths = gaps[gap_idx]
+		offsets = np.cumsum(lengths) - lengths
+		starts = values[gap_idx] + 1 - offsets
+		return (np.arange(lengths.sum()) + np.repeat(starts, lengths)).tolist()
 	for previous, current in zip(numbers, numbers[1:]):
 		gap = current - previous
 		if gap > 1:
@@ -117,10 +160,10 @@ def export_to_excel(reports: Sequence[ChapterReport], destination: Path) -> bool
 		return False
 
 	destination.parent.mkdir(parents=True, exist_ok=True)
-	workbook = Workbook()
-	sheet = workbook.active
-	sheet.title = "Missing Panels" # pyright: ignore[reportOptionalMemberAccess]
-	sheet.append([ # type: ignore
+	# Write-only mode streams rows to disk instead of holding every cell in memory.
+	workbook = Workbook(write_only=True)
+	sheet = workbook.create_sheet("Missing Panels")
+	sheet.append([
 		"Chapter",
 		"Panel count",
 		"Min",
@@ -129,7 +172,7 @@ def export_to_excel(reports: Sequence[ChapterReport], destination: Path) -> bool
 		"Duplicate numbers",
 	])
 	for report in reports:
-		sheet.append([ # type: ignore
+		sheet.append([
 			report.name,
 			report.panel_count,
 			report.min_panel if report.min_panel is not None else "",
@@ -157,7 +200,8 @@ def analyze_panels(
 		print(f"Panels directory not found: {panels_root}")
 		return 1
 
-	chapters = [entry for entry in panels_root.iterdir() if entry.is_dir()]
+	with os.scandir(panels_root) as it:
+		chapters = [Path(entry.path) for entry in it if entry.is_dir()]
 	if not chapters:
 		print("No chapter folders detected.")
 		return 1
@@ -203,9 +247,7 @@ def print_reports(reports: Sequence[ChapterReport]) -> None:
 
 
 def normalize_chapter_label(label: str) -> str:
-	clean = label.replace("_", " ")
-	clean = VOLUME_PATTERN.sub("", clean)
-	return re.sub(r"\s+", " ", clean).strip()
+	return _collapse_whitespace(" ", VOLUME_PATTERN.sub("", label.replace("_", " "))).strip()
 
 
 def extract_chapter_number(label: str) -> int | None:
@@ -220,12 +262,29 @@ def extract_chapter_number(label: str) -> int | None:
 
 
 
-def log_download_event(log_path: Path | None, message: str) -> None:
+_LOG_LOCK = threading.Lock()
+_CONNECTIONS = threading.local()
+# (connection, request target is the absolute URL, request headers)
+PooledRoute = tuple[HTTPConnection, bool, dict[str, str]]
+
+
+@contextmanager
+def open_download_log(log_path: Path | None) -> Iterator[TextIO | None]:
+	"""Open the download log once for a whole run; yields None when logging is off."""
 	if not log_path:
+		yield None
 		return
 	log_path.parent.mkdir(parents=True, exist_ok=True)
+	# Line buffered so every event reaches the file (and anyone tailing it) immediately.
+	with log_path.open("a", encoding="utf-8", buffering=1) as log_file:
+		yield log_file
+
+
+def log_download_event(log_file: TextIO | None, message: str) -> None:
+	if log_file is None:
+		return
 	timestamp = datetime.now(timezone.utc).isoformat()
-	with log_path.open("a", encoding="utf-8") as log_file:
+	with _LOG_LOCK:
 		log_file.write(f"[{timestamp}] {message}\n")
 
 
@@ -265,10 +324,97 @@ def normalize_panel_token_for_url(token: str) -> str:
 	return token
 
 
+def open_route(scheme: str, netloc: str) -> PooledRoute:
+	"""Open a connection to netloc, routed through any *_proxy environment proxy like urlopen."""
+	headers = {"User-Agent": USER_AGENT}
+	factory = HTTPSConnection if scheme == "https" else HTTPConnection
+	host = netloc.rpartition("@")[2]
+	proxy = None if proxy_bypass(host) else getproxies().get(scheme)
+	if not proxy:
+		return factory(host), False, headers
+	proxy_parts = urlsplit(proxy if "//" in proxy else f"//{proxy}")
+	proxy_headers: dict[str, str] = {}
+	if proxy_parts.username is not None:
+		credentials = f"{unquote(proxy_parts.username)}:{unquote(proxy_parts.password or '')}"
+		proxy_headers["Proxy-Authorization"] = "Basic " + b64encode(credentials.encode()).decode("ascii")
+	proxy_host = proxy_parts.netloc.rpartition("@")[2]
+	if scheme == "https":
+		# CONNECT tunnel: TLS runs end to end with the target host.
+		connection = HTTPSConnection(proxy_host)
+		connection.set_tunnel(host, headers=proxy_headers)
+		return connection, False, headers
+	headers.update(proxy_headers)
+	return HTTPConnection(proxy_host), True, headers
+
+
+def send_pooled_request(url: str) -> tuple[HTTPConnection, HTTPResponse]:
+	"""Send a GET over this thread's keep-alive connection to the URL's host."""
+	parts = urlsplit(url)
+	if parts.scheme not in {"http", "https"}:
+		raise URLError(f"unsupported URL scheme {parts.scheme!r}")
+	key = (parts.scheme, parts.netloc)
+	pool: dict[tuple[str, str], PooledRoute] = _CONNECTIONS.__dict__.setdefault("pool", {})
+	while True:
+		route = pool.get(key)
+		if route is None:
+			route = pool[key] = open_route(parts.scheme, parts.netloc)
+		connection, absolute_target, headers = route
+		# Only a socket kept alive from an earlier request can have gone stale.
+		reused = connection.sock is not None
+		# Plain-HTTP proxies take the absolute URL as the request target.
+		target = url if absolute_target else urlunsplit(("", "", parts.path or "/", parts.query, ""))
+		try:
+			connection.request("GET", target, headers=headers)
+			return connection, connection.getresponse()
+		except (HTTPException, OSError) as error:
+			connection.close()
+			pool.pop(key, None)
+			# The server may have dropped the idle socket; retry once on a fresh connection.
+			# Failures on a fresh connect (refused, DNS, TLS) are reported straight away.
+			if not reused:
+				raise URLError(error) from error
+
+
+def drop_pooled_connection(url: str) -> None:
+	parts = urlsplit(url)
+	route = _CONNECTIONS.__dict__.get("pool", {}).pop((parts.scheme, parts.netloc), None)
+	if route is not None:
+		route[0].close()
+
+
+@contextmanager
+def open_pooled_url(url: str) -> Iterator[HTTPResponse]:
+	"""GET a URL over this thread's keep-alive connection to its host.
+
+	Follows redirects (to any host) and honours proxy environment variables. Raises
+	HTTPError for non-2xx statuses and URLError for connection problems, mirroring urlopen.
+	"""
+	for _ in range(MAX_REDIRECTS + 1):
+		connection, response = send_pooled_request(url)
+		location = response.headers.get("Location")
+		if response.status not in REDIRECT_STATUSES or not location:
+			break
+		# Drain the redirect body so the kept-alive connection can serve the next request.
+		response.read()
+		url = encode_url_for_request(urljoin(url, location))
+	else:
+		response.read()
+		raise HTTPError(url, response.status, "Too many redirects", response.headers, None)
+	try:
+		if not 200 <= response.status < 300:
+			response.read()
+			raise HTTPError(url, response.status, response.reason, response.headers, None)
+		yield response
+	finally:
+		# A partially read body leaves the socket unusable for the next request.
+		if not response.isclosed():
+			connection.close()
+			drop_pooled_connection(url)
+
+
 def probe_remote_panel(url: str) -> tuple[bool, bool]:
-	req = Request(url, headers={"User-Agent": USER_AGENT})
 	try:
-		with urlopen(req) as response:
+		with open_pooled_url(url) as response:
 			response.read(1)
 		return True, False
 	except HTTPError as error:
@@ -283,7 +429,7 @@ def discover_trailing_panels(
 	chapter_number: int,
 	panel_pad: int,
 	attempt_templates: Sequence[tuple[str, str]],
-	log_path: Path | None,
+	log_file: TextIO | None,
 ) -> List[int]:
 	trailing: List[int] = []
 	if report.max_panel is None:
@@ -307,7 +453,7 @@ def discover_trailing_panels(
 			success, forbidden = probe_remote_panel(request_url)
 			status = "TRAILING_FOUND" if success else ("FORBIDDEN" if forbidden else "TRAILING_MISSING")
 			log_download_event(
-				log_path,
+				log_file,
 				f"{report.name} trailing panel {panel_token} -> {status} | {raw_url}",
 			)
 			if success:
@@ -336,14 +482,99 @@ def write_trailing_panels_report(path: Path | None, mapping: dict[str, List[int]
 			handle.write(f"{chapter_name}: {panels}\n")
 
 
+def download_panel(
+	chapter_name: str,
+	chapter_path: Path,
+	panel: int,
+	chapter_token_for_url: str,
+	chapter_number: int,
+	panel_pad: int,
+	attempt_templates: Sequence[tuple[str, str]],
+	log_file: TextIO | None,
+	trailing: bool = False,
+	emit: Callable[[str], None] = print,
+) -> bool:
+	"""Try each URL template in turn, moving to the next one only after a 403."""
+	kind = "trailing panel" if trailing else "panel"
+	panel_token = str(panel).zfill(panel_pad)
+	panel_token_for_url = normalize_panel_token_for_url(panel_token)
+	last_forbidden = True
+	for attempt_index, (template, extension) in enumerate(attempt_templates):
+		if attempt_index > 0 and not last_forbidden:
+			break
+		destination = chapter_path / f"{panel_token}{extension}"
+		if attempt_index > 0:
+			label = extension.lstrip('.') or extension
+			emit(f"  · Retrying {kind} {panel_token} as {label.upper()} fallback…")
+		raw_url = template.format(
+			chapter=chapter_token_for_url,
+			panel=panel_token_for_url,
+			chapter_raw=chapter_number,
+			panel_raw=panel,
+		)
+		request_url = encode_url_for_request(raw_url)
+		success, forbidden = fetch_file(request_url, destination, emit)
+		status = "SUCCESS" if success else ("FORBIDDEN" if forbidden else "FAILURE")
+		log_download_event(
+			log_file,
+			f"{chapter_name} {kind} {panel_token} ({destination.name}) -> {status} | {raw_url}",
+		)
+		if success:
+			emit(f"    ✓ {kind.capitalize()} {panel_token} saved as {destination.name}.")
+			return True
+		last_forbidden = forbidden
+	return False
+
+
+def download_panels(
+	executor: ThreadPoolExecutor,
+	report: ChapterReport,
+	panels: Sequence[int],
+	chapter_token_for_url: str,
+	chapter_number: int,
+	panel_pad: int,
+	attempt_templates: Sequence[tuple[str, str]],
+	log_file: TextIO | None,
+	trailing: bool = False,
+) -> List[bool]:
+	"""Download panels concurrently, returning one success flag per panel in input order.
+
+	Workers buffer their console lines; they are printed here in panel order so the
+	output of concurrent downloads never interleaves.
+	"""
+	def run(panel: int) -> tuple[bool, List[str]]:
+		messages: List[str] = []
+		ok = download_panel(
+			report.name,
+			report.path,
+			panel,
+			chapter_token_for_url,
+			chapter_number,
+			panel_pad,
+			attempt_templates,
+			log_file,
+			trailing,
+			messages.append,
+		)
+		return ok, messages
+
+	outcomes: List[bool] = []
+	for ok, messages in executor.map(run, panels):
+		for message in messages:
+			print(message)
+		outcomes.append(ok)
+	return outcomes
+
+
 def download_trailing_candidates(
+	executor: ThreadPoolExecutor,
 	trailing_map: dict[str, List[int]],
 	reports_by_name: dict[str, ChapterReport],
 	attempt_templates: Sequence[tuple[str, str]],
 	extension_pool: set[str],
 	chapter_pad: int,
 	panel_pad: int,
-	log_path: Path | None,
+	log_file: TextIO | None,
 ) -> int:
 	downloading_total = 0
 	for chapter_name, panels in list(trailing_map.items()):
@@ -357,43 +588,26 @@ def download_trailing_candidates(
 		chapter_token = str(chapter_number).zfill(chapter_pad)
 		chapter_token_for_url = normalize_chapter_token_for_url(chapter_token)
 		print(f"\nDownloading trailing panels for {chapter_name}")
-		remaining: List[int] = []
+		pending: List[int] = []
 		for panel in panels:
 			panel_token = str(panel).zfill(panel_pad)
 			if any((report.path / f"{panel_token}{ext}").exists() for ext in extension_pool):
 				print(f"  · Trailing panel {panel_token} already exists locally; skipping.")
 				continue
-			panel_token_for_url = normalize_panel_token_for_url(panel_token)
-			last_forbidden = True
-			success = False
-			for attempt_index, (template, extension) in enumerate(attempt_templates):
-				if attempt_index > 0 and not last_forbidden:
-					break
-				destination = report.path / f"{panel_token}{extension}"
-				if attempt_index > 0:
-					label = extension.lstrip('.') or extension
-					print(f"  · Retrying trailing panel as {label.upper()} fallback…")
-				raw_url = template.format(
-					chapter=chapter_token_for_url,
-					panel=panel_token_for_url,
-					chapter_raw=chapter_number,
-					panel_raw=panel,
-				)
-				request_url = encode_url_for_request(raw_url)
-				ok, forbidden = fetch_file(request_url, destination)
-				status = "SUCCESS" if ok else ("FORBIDDEN" if forbidden else "FAILURE")
-				log_download_event(
-					log_path,
-					f"{chapter_name} trailing panel {panel_token} ({destination.name}) -> {status} | {raw_url}",
-				)
-				if ok:
-					print(f"    ✓ Trailing panel {panel_token} saved as {destination.name}.")
-					success = True
-					downloading_total += 1
-					break
-				last_forbidden = forbidden
-			if not success:
-				remaining.append(panel)
+			pending.append(panel)
+		outcomes = download_panels(
+			executor,
+			report,
+			pending,
+			chapter_token_for_url,
+			chapter_number,
+			panel_pad,
+			attempt_templates,
+			log_file,
+			trailing=True,
+		)
+		remaining = [panel for panel, ok in zip(pending, outcomes) if not ok]
+		downloading_total += len(pending) - len(remaining)
 		if remaining:
 			trailing_map[chapter_name] = remaining
 		else:
@@ -426,85 +640,77 @@ def download_missing_panels(
 	reports_by_name = {report.name: report for report in reports}
 	failures: dict[str, List[int]] = {}
 	trailing_map: dict[str, List[int]] = {}
-	for report in reports:
-		chapter_number = extract_chapter_number(report.name)
-		if chapter_number is None:
+	# The executor exits first, so every worker is done logging before the log closes.
+	with (
+		open_download_log(log_path) as log_file,
+		ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor,
+	):
+		for report in reports:
+			chapter_number = extract_chapter_number(report.name)
+			if chapter_number is None:
+				if report.missing:
+					print(f"\n{report.name}")
+					print("  · Could not infer chapter number from folder name; skipping downloads.")
+					failures[report.name] = report.missing.copy()
+				else:
+					print(f"\n{report.name}")
+					print("  · Could not infer chapter number; trailing scan skipped.")
+				continue
+			chapter_token = str(chapter_number).zfill(chapter_pad)
+			chapter_token_for_url = normalize_chapter_token_for_url(chapter_token)
 			if report.missing:
-				print(f"\n{report.name}")
-				print("  · Could not infer chapter number from folder name; skipping downloads.")
-				failures[report.name] = report.missing.copy()
-			else:
-				print(f"\n{report.name}")
-				print("  · Could not infer chapter number; trailing scan skipped.")
-			continue
-		chapter_token = str(chapter_number).zfill(chapter_pad)
-		chapter_token_for_url = normalize_chapter_token_for_url(chapter_token)
-		if report.missing:
-			print(f"\nDownloading missing panels for {report.name}")
-			for panel in report.missing:
-				panel_token = str(panel).zfill(panel_pad)
-				if any((report.path / f"{panel_token}{ext}").exists() for ext in extension_pool):
-					print(f"  · Skipping {panel_token} (already exists).")
-					continue
-				panel_token_for_url = normalize_panel_token_for_url(panel_token)
-				last_forbidden = True
-				attempt_failed = True
-				for attempt_index, (template, extension) in enumerate(attempt_templates):
-					if attempt_index > 0 and not last_forbidden:
-						break
-					destination = report.path / f"{panel_token}{extension}"
-					if attempt_index > 0:
-						label = extension.lstrip('.') or extension
-						print(f"  · Retrying as {label.upper()} fallback…")
-					raw_url = template.format(
-						chapter=chapter_token_for_url,
-						panel=panel_token_for_url,
-						chapter_raw=chapter_number,
-						panel_raw=panel,
-					)
-					request_url = encode_url_for_request(raw_url)
-					success, forbidden = fetch_file(request_url, destination)
-					status = "SUCCESS" if success else ("FORBIDDEN" if forbidden else "FAILURE")
-					log_download_event(
-						log_path,
-						f"{report.name} panel {panel_token} ({destination.name}) -> {status} | {raw_url}",
-					)
-					if success:
+				print(f"\nDownloading missing panels for {report.name}")
+				pending: List[int] = []
+				for panel in report.missing:
+					panel_token = str(panel).zfill(panel_pad)
+					if any((report.path / f"{panel_token}{ext}").exists() for ext in extension_pool):
+						print(f"  · Skipping {panel_token} (already exists).")
+						continue
+					pending.append(panel)
+				outcomes = download_panels(
+					executor,
+					report,
+					pending,
+					chapter_token_for_url,
+					chapter_number,
+					panel_pad,
+					attempt_templates,
+					log_file,
+				)
+				for panel, ok in zip(pending, outcomes):
+					if ok:
 						success_count += 1
-						print(f"    ✓ Panel {panel_token} saved as {destination.name}.")
-						attempt_failed = False
-						break
-					last_forbidden = forbidden
-				if attempt_failed:
-					failures.setdefault(report.name, []).append(panel)
-		trailing = discover_trailing_panels(
-			report,
-			chapter_token_for_url,
-			chapter_number,
-			panel_pad,
-			attempt_templates,
-			log_path,
-		)
-		if trailing:
-			trailing_map[report.name] = trailing
-	if trailing_map:
-		print("\nTrailing panel candidates detected:")
-		for chapter_name, panels in trailing_map.items():
-			print(f"  · {chapter_name}: {', '.join(map(str, panels))}")
-		if prompt_yes_no("Download these trailing panels now? [y/N]: "):
-			additional = download_trailing_candidates(
-				trailing_map,
-				reports_by_name,
-				attempt_templates,
-				extension_pool,
-				chapter_pad,
+					else:
+						failures.setdefault(report.name, []).append(panel)
+			trailing = discover_trailing_panels(
+				report,
+				chapter_token_for_url,
+				chapter_number,
 				panel_pad,
-				log_path,
+				attempt_templates,
+				log_file,
 			)
-			if additional:
-				print(f"  Trailing panels downloaded: {additional}")
-		else:
-			print("  Skipping trailing panel download for now.")
+			if trailing:
+				trailing_map[report.name] = trailing
+		if trailing_map:
+			print("\nTrailing panel candidates detected:")
+			for chapter_name, panels in trailing_map.items():
+				print(f"  · {chapter_name}: {', '.join(map(str, panels))}")
+			if prompt_yes_no("Download these trailing panels now? [y/N]: "):
+				additional = download_trailing_candidates(
+					executor,
+					trailing_map,
+					reports_by_name,
+					attempt_templates,
+					extension_pool,
+					chapter_pad,
+					panel_pad,
+					log_file,
+				)
+				if additional:
+					print(f"  Trailing panels downloaded: {additional}")
+			else:
+				print("  Skipping trailing panel download for now.")
 	if total_targets == 0:
 		print("\nNo missing panels need downloading.")
 	elif failures:
@@ -527,24 +733,20 @@ def download_missing_panels(
 	return failures
 
 
-def fetch_file(url: str, destination: Path) -> tuple[bool, bool]:
-	req = Request(url, headers={"User-Agent": USER_AGENT})
+def fetch_file(url: str, destination: Path, emit: Callable[[str], None] = print) -> tuple[bool, bool]:
 	try:
-		with urlopen(req) as response, destination.open("wb") as output:
-			chunk = response.read(8192)
-			while chunk:
-				output.write(chunk)
-				chunk = response.read(8192)
-		print(f"  · Downloaded {destination.name}")
+		with open_pooled_url(url) as response, destination.open("wb", buffering=0) as output:
+			shutil.copyfileobj(response, output, DOWNLOAD_CHUNK_SIZE)
+		emit(f"  · Downloaded {destination.name}")
 		return True, False
 	except HTTPError as error:
-		print(f"  · {destination.name} failed ({error.code} {error.reason}).")
+		emit(f"  · {destination.name} failed ({error.code} {error.reason}).")
 		return False, error.code == 403
 	except URLError as error:
-		print(f"  · {destination.name} failed ({error.reason}).")
+		emit(f"  · {destination.name} failed ({error.reason}).")
 		return False, False
 	except OSError as error:
-		print(f"  · Unable to write {destination}: {error}.")
+		emit(f"  · Unable to write {destination}: {error}.")
 		return False, False
 
 
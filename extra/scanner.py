@@ -2,24 +2,63 @@
 
 from __future__ import annotations
 
+import hashlib
+import io
+import math
+import multiprocessing
+import os
+import sqlite3
 import threading
 import tkinter as tk
-from dataclasses import dataclass
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass, field
 from pathlib import Path
+from stat import S_ISREG
 from tkinter import filedialog, messagebox, ttk
-from typing import Callable, Iterable, List, Sequence
+from typing import BinaryIO, Callable, Iterable, List, Sequence
 
 try:
 	from PIL import Image, ImageTk
 except ImportError as exc: # pragma: no cover
 	raise SystemExit("scanner.py now requires Pillow. Install it via 'pip install pillow'.") from exc
 
+try:
+	import numpy as np
+except ImportError as exc: # pragma: no cover
+	raise SystemExit("scanner.py now requires NumPy. Install it via 'pip install numpy'.") from exc
+
 DEFAULT_ROOT = Path(__file__).resolve().parents[1] / "panels"
 VALID_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp")
 HASH_SIZE = 12
+# JPEG draft target. At 1/8 scale the DCT-scaling blur shifts hash bits on resized copies;
+# asking for 16x the hash size keeps typical panels at 1/4 or 1/2 scale, which matches
+# full decodes on resized-copy detection while still skipping most decode work.
+DRAFT_SIZE = (HASH_SIZE * 16, HASH_SIZE * 16)
+HASH_WORDS = (HASH_SIZE * HASH_SIZE + 63) // 64
+PAIR_BLOCK_SIZE = 32
+MEASURE_CHUNKSIZE = 16
+POPCOUNT = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
 RESAMPLE = Image.Resampling.LANCZOS
+# Only for undrafted full-size decodes (PNG, WebP), where a block average tracks LANCZOS
+# closely. Drafted JPEGs are already small, so they keep LANCZOS at negligible cost.
+HASH_RESAMPLE = Image.Resampling.BOX
 PREVIEW_SIZE = (420, 640)
+PREVIEW_CACHE_SIZE = 32
+STATUS_UPDATE_INTERVAL_MS = 100
 DIMENSION_RATIO_TOLERANCE = 0.1
+# Log-scale bucket width matching the ratio tolerance (shaved by 1% so float rounding
+# cannot push a close pair two buckets apart); close panels always share or neighbour a bucket.
+DIMENSION_BUCKET_SCALE = 0.99 / -math.log1p(-DIMENSION_RATIO_TOLERANCE)
+CACHE_FILENAME = ".waguri_hashes.sqlite"
+# Bumped whenever the hash pipeline changes so stale hashes are recomputed.
+CACHE_VERSION = 3
+
+# Cached hash keyed by panel path: (mtime_ns, size, width, height, hash_value).
+CacheEntry = tuple[int, int, int, int, int]
+# A listed panel file: (path, lstat result, still-valid cache entry or None).
+PanelCandidate = tuple[str, os.stat_result, CacheEntry | None]
 
 
 @dataclass(slots=True)
@@ -28,6 +67,14 @@ class PanelInfo:
 	width: int
 	height: int
 	hash_value: int
+	mtime_ns: int = 0
+	size: int = 0
+	hash_bytes: np.ndarray = field(init=False, repr=False, compare=False)
+	bucket: tuple[int, int] = field(init=False, repr=False, compare=False)
+
+	def __post_init__(self) -> None:
+		self.hash_bytes = hash_to_bytes(self.hash_value)
+		self.bucket = (dimension_bucket(self.width), dimension_bucket(self.height))
 
 
 @dataclass(slots=True)
@@ -37,60 +84,261 @@ class SimilarPair:
 	distance: int
 
 
-def compute_average_hash(image: Image.Image, hash_size: int = HASH_SIZE) -> int:
-	gray = image.convert("L").resize((hash_size, hash_size), RESAMPLE)
-	pixels = list(gray.getdata()) # type: ignore[arg-type]
-	average = sum(pixels) / len(pixels)
-	result = 0
-	for value in pixels:
-		result = (result << 1) | (1 if value >= average else 0)
-	return result
+def compute_average_hash(
+	image: Image.Image,
+	hash_size: int = HASH_SIZE,
+	resample: Image.Resampling = RESAMPLE,
+) -> int:
+	# convert() copies even when the mode already matches, e.g. after an "L" draft.
+	gray = image if image.mode == "L" else image.convert("L")
+	return hash_from_thumbnail(gray.resize((hash_size, hash_size), resample))
+
+
+def hash_from_thumbnail(thumbnail: Image.Image) -> int:
+	"""Average-hash an already grayscale, already resized image."""
+	pixels = np.asarray(thumbnail, dtype=np.uint8)
+	bits = (pixels >= pixels.mean()).ravel()
+	# packbits zero-fills the last byte, so shift that padding back out to keep the
+	# first pixel as the most significant bit for any hash size.
+	packed = np.packbits(bits, bitorder="big")
+	return int.from_bytes(packed.tobytes(), "big") >> (-bits.size % 8)
+
+
+def hash_to_bytes(hash_value: int) -> np.ndarray:
+	"""Lay a hash out as big-endian uint8 words so it can be XORed against a matrix of hashes."""
+	return np.frombuffer(hash_value.to_bytes(HASH_WORDS * 8, "big"), dtype=np.uint8)
+
+
+def dimension_bucket(length: int) -> int:
+	return int(math.log(max(length, 1)) * DIMENSION_BUCKET_SCALE)
+
+
+def load_cache(root_path: Path) -> dict[str, CacheEntry]:
+	"""Read hashes from a previous scan; a missing or outdated cache is treated as empty."""
+	cache_path = root_path / CACHE_FILENAME
+	if not cache_path.is_file():
+		return {}
+	try:
+		with closing(sqlite3.connect(cache_path)) as connection:
+			(version,) = connection.execute("PRAGMA user_version").fetchone()
+			if version != CACHE_VERSION:
+				return {}
+			rows = connection.execute("SELECT path, mtime, size, width, height, hash FROM panels").fetchall()
+	except sqlite3.Error:
+		return {}
+	return {
+		path: (mtime, size, width, height, int.from_bytes(blob, "big"))
+		for path, mtime, size, width, height, blob in rows
+	}
+
+
+def save_cache(root_path: Path, cache: dict[str, CacheEntry]) -> None:
+	"""Replace the cache with the given entries; failures only cost a slower next scan."""
+	try:
+		with closing(sqlite3.connect(root_path / CACHE_FILENAME)) as connection, connection:
+			connection.execute("DROP TABLE IF EXISTS panels")
+			connection.execute(
+				"CREATE TABLE panels (path TEXT PRIMARY KEY, mtime INTEGER, size INTEGER, "
+				"width INTEGER, height INTEGER, hash BLOB)"
+			)
+			connection.executemany(
+				"INSERT INTO panels VALUES (?, ?, ?, ?, ?, ?)",
+				(
+					(path, mtime, size, width, height, hash_value.to_bytes(HASH_WORDS * 8, "big"))
+					for path, (mtime, size, width, height, hash_value) in cache.items()
+				),
+			)
+			connection.execute(f"PRAGMA user_version = {CACHE_VERSION}")
+	except sqlite3.Error:
+		pass
+
+
+def measure_panel(source: str | BinaryIO) -> tuple[int, int, int]:
+	"""Decode a panel just far enough to return its (width, height, average hash)."""
+	with Image.open(source) as src:
+		width, height = src.size
+		# Let JPEG decoding downscale in the DCT domain; the hash only needs luminance.
+		drafted = src.draft("L", DRAFT_SIZE) is not None
+		return width, height, compute_average_hash(src, resample=RESAMPLE if drafted else HASH_RESAMPLE)
+
+
+def list_panel_candidates(
+	chapter_path: Path,
+	extensions: Sequence[str],
+	cache: dict[str, CacheEntry] | None = None,
+) -> List[PanelCandidate]:
+	"""List a chapter's panel files in name order, attaching any still-valid cache entry."""
+	suffixes = tuple(extensions)
+	with os.scandir(chapter_path) as it:
+		entries = [entry for entry in it if entry.name.lower().endswith(suffixes)]
+	entries.sort(key=lambda entry: entry.name)
+	candidates: List[PanelCandidate] = []
+	for entry in entries:
+		try:
+			# One stat serves the regular-file check and the cache key; DirEntry keeps it.
+			# Symlinked panels count, as with Path.is_file(), so the link target is stat'ed.
+			stat = entry.stat()
+		except OSError:
+			continue
+		if not S_ISREG(stat.st_mode):
+			continue
+		cached = cache.get(entry.path) if cache else None
+		if cached is not None and cached[:2] != (stat.st_mtime_ns, stat.st_size):
+			cached = None
+		candidates.append((entry.path, stat, cached))
+	return candidates
+
+
+def read_panel_size(path: str) -> tuple[int, int] | None:
+	try:
+		with Image.open(path) as src:
+			return src.size
+	except OSError:
+		return None
+
+
+def skip_isolated_panels(candidates: Sequence[PanelCandidate]) -> List[PanelCandidate]:
+	"""Drop undecoded panels whose dimensions leave no other panel close enough to pair with.
+
+	Image.open only parses the header, so reading sizes is far cheaper than hashing.
+	"""
+	buckets: List[tuple[int, int] | None] = []
+	for path, _, cached in candidates:
+		size = cached[2:4] if cached is not None else read_panel_size(path)
+		buckets.append(None if size is None else (dimension_bucket(size[0]), dimension_bucket(size[1])))
+	counts = Counter(bucket for bucket in buckets if bucket is not None)
+	kept: List[PanelCandidate] = []
+	for candidate, bucket in zip(candidates, buckets):
+		if candidate[2] is None:
+			if bucket is None:
+				continue
+			neighbours = sum(
+				counts[(bucket[0] + dx, bucket[1] + dy)] for dx in (-1, 0, 1) for dy in (-1, 0, 1)
+			)
+			if neighbours <= 1:
+				continue
+		kept.append(candidate)
+	return kept
+
 
+def group_measure_jobs(candidates: Sequence[PanelCandidate]) -> List[List[str]]:
+	"""Group the panels that still need decoding by byte size; only same-size files can be copies."""
+	jobs: dict[int, List[str]] = defaultdict(list)
+	for path, stat, cached in candidates:
+		if cached is None:
+			jobs[stat.st_size].append(path)
+	return list(jobs.values())
 
-def hamming_distance(first: int, second: int) -> int:
-	return (first ^ second).bit_count()
 
+def measure_panels(paths: Sequence[str]) -> List[tuple[int, int, int] | None]:
+	"""Measure a group of same-size panels, decoding each distinct file content once.
 
-def gather_panels(chapter_path: Path, extensions: Sequence[str]) -> List[PanelInfo]:
-	records: List[PanelInfo] = []
-	for entry in sorted(chapter_path.iterdir()):
-		if not entry.is_file() or entry.suffix.lower() not in extensions:
-			continue
+	Returns one (width, height, hash) per path, or None where the file could not be read.
+	"""
+	if len(paths) == 1:
 		try:
-			with Image.open(entry) as src:
-				image = src.convert("RGB")
-				width, height = image.size
-				hash_value = compute_average_hash(image)
+			return [measure_panel(paths[0])]
 		except OSError:
-			continue
-		records.append(PanelInfo(entry, width, height, hash_value))
+			return [None]
+	results: List[tuple[int, int, int] | None] = []
+	measured_by_digest: dict[bytes, tuple[int, int, int]] = {}
+	for path in paths:
+		try:
+			data = Path(path).read_bytes()
+			digest = hashlib.blake2b(data, digest_size=16).digest()
+			measured = measured_by_digest.get(digest)
+			if measured is None:
+				measured = measured_by_digest[digest] = measure_panel(io.BytesIO(data))
+		except OSError:
+			measured = None
+		results.append(measured)
+	return results
+
+
+def build_panel_records(
+	candidates: Sequence[PanelCandidate],
+	measured: dict[str, tuple[int, int, int] | None],
+) -> List[PanelInfo]:
+	records: List[PanelInfo] = []
+	for path, stat, cached in candidates:
+		if cached is not None:
+			_, _, width, height, hash_value = cached
+		else:
+			result = measured.get(path)
+			if result is None:
+				continue
+			width, height, hash_value = result
+		records.append(PanelInfo(Path(path), width, height, hash_value, stat.st_mtime_ns, stat.st_size))
 	return records
 
 
-def dimensions_close(a: PanelInfo, b: PanelInfo) -> bool:
-	width_diff = abs(a.width - b.width)
-	height_diff = abs(a.height - b.height)
-	max_width = max(a.width, b.width) or 1
-	max_height = max(a.height, b.height) or 1
-	return (
-		width_diff <= max_width * DIMENSION_RATIO_TOLERANCE
-		and height_diff <= max_height * DIMENSION_RATIO_TOLERANCE
-	)
+def search_similar_indices(sorted_records: Sequence[PanelInfo], threshold: int) -> List[tuple[int, int, int]]:
+	"""Return (index, other index, distance) for every matching pair, with index < other index."""
+	# Parallel arrays (structure of arrays) so the hash and dimension gates run vectorized.
+	hash_matrix = np.stack([record.hash_bytes for record in sorted_records])
+	widths = np.array([record.width for record in sorted_records], dtype=np.int64)
+	heights = np.array([record.height for record in sorted_records], dtype=np.int64)
+	buckets: defaultdict[tuple[int, int], List[int]] = defaultdict(list)
+	for idx, record in enumerate(sorted_records):
+		buckets[record.bucket].append(idx)
+	found: List[tuple[int, int, int]] = []
+	for (bucket_x, bucket_y), members in buckets.items():
+		# Only the 3x3 block of neighbouring buckets can hold panels with close dimensions.
+		neighborhood = np.array(
+			sorted(
+				idx
+				for dx in (-1, 0, 1)
+				for dy in (-1, 0, 1)
+				for idx in buckets.get((bucket_x + dx, bucket_y + dy), ())
+			)
+		)
+		neighbor_hashes = hash_matrix[neighborhood]
+		member_indices = np.array(members)
+		# Broadcast a block of members against the whole neighbourhood at once; blocking
+		# bounds the (members, neighbours, bytes) XOR tensor for very large buckets.
+		for start in range(0, member_indices.size, PAIR_BLOCK_SIZE):
+			block = member_indices[start : start + PAIR_BLOCK_SIZE]
+			# Members are ascending, so neighbours at or before the block's first index never pair.
+			first = int(np.searchsorted(neighborhood, block[0], side="right"))
+			if first == neighborhood.size:
+				break
+			others = neighborhood[first:]
+			xor = np.bitwise_xor(hash_matrix[block][:, None, :], neighbor_hashes[None, first:, :])
+			distances = POPCOUNT[xor].sum(axis=2, dtype=np.uint16)
+			matches = (distances <= threshold) & (others[None, :] > block[:, None])
+			# Dimensions are close when each side differs by at most DIMENSION_RATIO_TOLERANCE
+			# of the larger of the two lengths.
+			for lengths in (widths, heights):
+				left_lengths, right_lengths = lengths[block][:, None], lengths[others][None, :]
+				matches &= np.abs(left_lengths - right_lengths) <= (
+					np.maximum(left_lengths, right_lengths) * DIMENSION_RATIO_TOLERANCE
+				)
+			for row, col in np.argwhere(matches):
+				found.append((int(block[row]), int(others[col]), int(distances[row, col])))
+	return found
 
 
 def find_similar_pairs(records: Sequence[PanelInfo], threshold: int) -> List[SimilarPair]:
-	pairs: List[SimilarPair] = []
 	sorted_records = sorted(records, key=lambda item: item.width * item.height)
-	count = len(sorted_records)
-	for idx in range(count):
-		left = sorted_records[idx]
-		for right in sorted_records[idx + 1 :]:
-			if not dimensions_close(left, right):
-				continue
-			distance = hamming_distance(left.hash_value, right.hash_value)
-			if distance <= threshold:
-				pairs.append(SimilarPair(left, right, distance))
-	return pairs
+	if not sorted_records:
+		return []
+	# Exact copies (same hash and size) match each other and every outside panel identically,
+	# so search only the first of each cluster and fan its matches back out to the copies.
+	clusters: defaultdict[tuple[int, int, int], List[int]] = defaultdict(list)
+	for idx, record in enumerate(sorted_records):
+		clusters[(record.hash_value, record.width, record.height)].append(idx)
+	copies = list(clusters.values())
+	found: List[tuple[int, int, int]] = []
+	if threshold >= 0:
+		for members in copies:
+			found.extend((idx, other, 0) for pos, idx in enumerate(members) for other in members[pos + 1 :])
+	representatives = [sorted_records[members[0]] for members in copies]
+	for rep, rep_other, distance in search_similar_indices(representatives, threshold):
+		for idx in copies[rep]:
+			for other in copies[rep_other]:
+				found.append((min(idx, other), max(idx, other), distance))
+	found.sort()
+	return [SimilarPair(sorted_records[idx], sorted_records[other], distance) for idx, other, distance in found]
 
 
 def scan_repository(
@@ -100,12 +348,58 @@ def scan_repository(
 	progress_cb: Callable[[str], None],
 ) -> List[SimilarPair]:
 	pairs: List[SimilarPair] = []
-	chapters = sorted((p for p in root_path.iterdir() if p.is_dir()), key=lambda path: path.name.lower())
+	with os.scandir(root_path) as it:
+		# DirEntry.is_dir() answers from the directory listing instead of a stat per entry.
+		chapters = sorted((Path(entry.path) for entry in it if entry.is_dir()), key=lambda path: path.name.lower())
 	if not chapters:
 		chapters = [root_path]
-	for idx, chapter in enumerate(chapters, start=1):
-		progress_cb(f"Scanning {chapter.name} ({idx}/{len(chapters)})…")
-		records = gather_panels(chapter, extensions)
+	progress_cb(f"Scanning {len(chapters)} chapter(s)…")
+	cached_by_chapter: dict[str, dict[str, CacheEntry]] = defaultdict(dict)
+	for path, cached in load_cache(root_path).items():
+		cached_by_chapter[os.path.dirname(path)][path] = cached
+	candidates_by_chapter = {
+		chapter: skip_isolated_panels(
+			list_panel_candidates(chapter, extensions, cached_by_chapter.get(str(chapter)))
+		)
+		for chapter in chapters
+	}
+	jobs = [
+		(chapter, job)
+		for chapter, candidates in candidates_by_chapter.items()
+		for job in group_measure_jobs(candidates)
+	]
+	measured: dict[str, tuple[int, int, int] | None] = {}
+	if jobs:
+		# Decoding is CPU-bound and independent per file group, so it is spread across
+		# processes at file granularity; a fully cached rescan never starts the pool.
+		remaining = Counter(chapter for chapter, _ in jobs)
+		workers = os.cpu_count() or 1
+		chunksize = max(1, min(MEASURE_CHUNKSIZE, len(jobs) // (workers * 4)))
+		# Spawn rather than fork: this runs on the scan thread while Tk and the preview
+		# threads are alive, and forking a multi-threaded process can deadlock the child.
+		with ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) as pool:
+			results = pool.map(measure_panels, [job for _, job in jobs], chunksize=chunksize)
+			chapters_done = 0
+			for (chapter, job), job_results in zip(jobs, results):
+				measured.update(zip(job, job_results))
+				remaining[chapter] -= 1
+				if not remaining[chapter]:
+					chapters_done += 1
+					progress_cb(f"Scanned {chapter.name} ({chapters_done}/{len(remaining)})…")
+	records_by_chapter = {
+		chapter: build_panel_records(candidates, measured)
+		for chapter, candidates in candidates_by_chapter.items()
+	}
+	save_cache(
+		root_path,
+		{
+			str(record.path): (record.mtime_ns, record.size, record.width, record.height, record.hash_value)
+			for records in records_by_chapter.values()
+			for record in records
+		},
+	)
+	for chapter in chapters:
+		records = records_by_chapter[chapter]
 		if not records:
 			continue
 		pairs.extend(find_similar_pairs(records, threshold))
@@ -127,6 +421,9 @@ class ScannerApp:
 		self.duplicate_pairs: List[SimilarPair] = []
 		self.left_preview: ImageTk.PhotoImage | None = None
 		self.right_preview: ImageTk.PhotoImage | None = None
+		self._preview_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="preview")
+		self._preview_cache: OrderedDict[Path, ImageTk.PhotoImage] = OrderedDict()
+		self._preview_request = 0
 		self.scan_thread: threading.Thread | None = None
 
 		self._build_ui()
@@ -222,16 +519,36 @@ class ScannerApp:
 		self.status_var.set("Starting scan…")
 		self.scan_button.config(state=tk.DISABLED)
 
+		# Coalesce progress into at most one Tk update per interval; the trailing flush
+		# always shows the newest message, so the final one is never dropped.
+		progress_lock = threading.Lock()
+		latest_message = ""
+		flush_scheduled = False
+
+		def flush_progress() -> None:
+			nonlocal flush_scheduled
+			with progress_lock:
+				message = latest_message
+				flush_scheduled = False
+			self.status_var.set(message)
+
 		def progress_cb(message: str) -> None:
-			self.root.after(0, lambda: self.status_var.set(message))
+			nonlocal latest_message, flush_scheduled
+			with progress_lock:
+				latest_message = message
+				if flush_scheduled:
+					return
+				flush_scheduled = True
+			self.root.after(STATUS_UPDATE_INTERVAL_MS, flush_progress)
 
 		def worker() -> None:
+			# Results use the flush delay so a pending progress flush cannot overwrite their status.
 			try:
 				pairs = scan_repository(root_path, VALID_EXTENSIONS, threshold, progress_cb)
 			except Exception as error: # pragma: no cover - GUI feedback path
-				self.root.after(0, lambda: self._on_scan_failed(error))
+				self.root.after(STATUS_UPDATE_INTERVAL_MS, lambda: self._on_scan_failed(error))
 				return
-			self.root.after(0, lambda: self._on_scan_complete(pairs))
+			self.root.after(STATUS_UPDATE_INTERVAL_MS, lambda: self._on_scan_complete(pairs))
 
 		self.scan_thread = threading.Thread(target=worker, daemon=True)
 		self.scan_thread.start()
@@ -263,6 +580,8 @@ class ScannerApp:
 		self.right_canvas.config(image="", text="")
 		self.left_preview = None
 		self.right_preview = None
+		# Invalidate previews still loading for the previous selection.
+		self._preview_request += 1
 
 	def _on_pair_select(self, event: tk.Event | None = None) -> None: # type: ignore[override]
 		selection = self.pair_listbox.curselection()
@@ -274,15 +593,49 @@ class ScannerApp:
 		if index >= len(self.duplicate_pairs):
 			return
 		pair = self.duplicate_pairs[index]
-		self.left_preview = self._load_preview(pair.left.path)
-		self.right_preview = self._load_preview(pair.right.path)
-		left_image: ImageTk.PhotoImage | str = self.left_preview if self.left_preview is not None else ""
-		right_image: ImageTk.PhotoImage | str = self.right_preview if self.right_preview is not None else ""
-		self.left_canvas.config(image=left_image, text=str(pair.left.path))
-		self.right_canvas.config(image=right_image, text=str(pair.right.path))
+		self._clear_previews()
+		self.left_canvas.config(text=str(pair.left.path))
+		self.right_canvas.config(text=str(pair.right.path))
+		self._request_preview("left", pair.left.path, self._preview_request)
+		self._request_preview("right", pair.right.path, self._preview_request)
 		self._update_action_buttons()
 
-	def _load_preview(self, path: Path) -> ImageTk.PhotoImage | None:
+	def _request_preview(self, side: str, path: Path, request: int) -> None:
+		cached = self._preview_cache.get(path)
+		if cached is not None:
+			self._preview_cache.move_to_end(path)
+			self._show_preview(side, cached)
+			return
+
+		def on_loaded(future: Future[Image.Image | None]) -> None:
+			try:
+				self.root.after(0, self._install_preview, side, path, request, future.result())
+			except (RuntimeError, tk.TclError): # pragma: no cover - window already closed
+				pass
+
+		self._preview_executor.submit(self._load_preview, path).add_done_callback(on_loaded)
+
+	def _install_preview(self, side: str, path: Path, request: int, image: Image.Image | None) -> None:
+		# PhotoImage must be created on the Tk thread; decoding already happened in the pool.
+		photo = ImageTk.PhotoImage(image) if image is not None else None
+		if photo is not None:
+			self._preview_cache[path] = photo
+			if len(self._preview_cache) > PREVIEW_CACHE_SIZE:
+				self._preview_cache.popitem(last=False)
+		if request == self._preview_request:
+			self._show_preview(side, photo)
+
+	def _show_preview(self, side: str, photo: ImageTk.PhotoImage | None) -> None:
+		image: ImageTk.PhotoImage | str = photo if photo is not None else ""
+		if side == "left":
+			self.left_preview = photo
+			self.left_canvas.config(image=image)
+		else:
+			self.right_preview = photo
+			self.right_canvas.config(image=image)
+
+	@staticmethod
+	def _load_preview(path: Path) -> Image.Image | None:
 		if not path.exists():
 			return None
 		try:
@@ -291,7 +644,7 @@ class ScannerApp:
 				preview.thumbnail(PREVIEW_SIZE, RESAMPLE)
 		except OSError:
 			return None
-		return ImageTk.PhotoImage(preview)
+		return preview
 
 	def _resolve_pair(self, delete_side: str) -> None:
 		selection = self.pair_listbox.curselection()
@@ -313,6 +666,7 @@ class ScannerApp:
 		except OSError as error:
 			messagebox.showerror("Delete failed", f"Could not delete {target}: {error}")
 			return
+		self._preview_cache.pop(target, None)
 		self.status_var.set(f"Deleted {target.name}.")
 		self._remove_pair_at(index)
 
@@ -336,7 +690,10 @@ class ScannerApp:
 		self.keep_right_button.config(state=state)
 
 	def run(self) -> None:
-		self.root.mainloop()
+		try:
+			self.root.mainloop()
+		finally:
+			self._preview_executor.shutdown(wait=False, cancel_futures=True)
 
 
 def main(_: Iterable[str] | None = None) -> int: